@@ -1,13 +1,31 @@
 """N-dimensional word search implementation."""
 
+import itertools
 import random
 import string
 from contextlib import suppress
-from dataclasses import dataclass
-from typing import Any, Dict, Optional, Union, List, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Union, List, Tuple
 
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Fallback to plain Python if numba is not installed."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+else:
+    HAS_NUMBA = True
+
+
+# Lookup table from grid codes to letters, where 0 is an empty cell
+LETTERS = np.array([''] + list(string.ascii_lowercase))
+
 
 class WordSearchError(RuntimeError):
     """Base error class."""
@@ -45,6 +63,168 @@ class NoMoreRetriesError(WordSearchError):
         super().__init__(f'failed to add {word}')
 
 
+class WordCharacterError(WordSearchError):
+    """Word contains unsupported characters."""
+
+    def __init__(self, word: str):
+        super().__init__(f'{word!r} must only contain the letters a-z')
+
+
+def encode_word(word: str) -> np.ndarray:
+    """Convert a word to an array of grid codes.
+
+    Raises:
+        WordCharacterError: If the word contains anything other than a-z.
+    """
+    if not (word.isascii() and word.isalpha() and word.islower()):
+        raise WordCharacterError(word)
+    return (np.frombuffer(word.encode('ascii'), dtype=np.uint8) - (ord('a') - 1)).astype(np.int8)
+
+
+def encode_words(words: List[str]) -> List[Optional[np.ndarray]]:
+    """Convert multiple words to arrays of grid codes in one pass.
+
+    Returns:
+        The codes for each word, or None if it contains anything other than a-z.
+    """
+    lengths = np.fromiter(map(len, words), dtype=np.intp, count=len(words))
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+
+    # UTF-32 guarantees a single code unit per character
+    codes = np.frombuffer(''.join(words).encode('utf-32-le'), dtype='<u4').astype(np.int64) - (ord('a') - 1)
+    invalid = np.concatenate([[0], np.cumsum((codes < 1) | (codes >= len(LETTERS)))])
+    valid = invalid[ends] == invalid[starts]
+
+    codes = codes.astype(np.int8)
+    return [codes[start:end] if ok else None for start, end, ok in zip(starts, ends, valid)]
+
+
+@njit(cache=True)
+def _place_loop(flat: np.ndarray, shape: np.ndarray, strides: np.ndarray, start: np.ndarray,
+                direction: np.ndarray, word_codes: np.ndarray, empty: np.ndarray) -> bool:
+    """Write a word into the flattened grid codes if it fits.
+
+    Parameters:
+        flat: Flattened grid of letter codes, where 0 is an empty cell.
+        shape: Shape of the grid.
+        strides: Number of flat cells to move per step along each axis.
+        start: Coordinate of the first letter.
+        direction: Step to take between each letter.
+        word_codes: Letter codes of the word.
+        empty: Output array marking which letters went into empty cells.
+
+    Returns:
+        If the word was written.
+    """
+    length = len(word_codes)
+
+    # Check the end point is still within bounds
+    index = step = 0
+    for axis in range(len(shape)):
+        end = start[axis] + direction[axis] * length
+        if end < -1 or end > shape[axis]:
+            return False
+        index += start[axis] * strides[axis]
+        step += direction[axis] * strides[axis]
+
+    # Check the current direction words
+    for i in range(length):
+        code = flat[index + i * step]
+        if code != 0 and code != word_codes[i]:
+            return False
+        empty[i] = code == 0
+
+    # Update the data
+    for i in range(length):
+        flat[index + i * step] = word_codes[i]
+    return True
+
+
+def _place_vectorized(flat: np.ndarray, shape: np.ndarray, strides: np.ndarray, start: np.ndarray,
+                      direction: np.ndarray, word_codes: np.ndarray, empty: np.ndarray) -> bool:
+    """Write a word into the flattened grid codes if it fits.
+
+    This gathers the whole path at once, which is much faster than
+    looping in Python when numba is not available.
+    See `_place_loop` for the parameters.
+    """
+    coords = start + np.arange(len(word_codes))[:, None] * direction
+    if np.any(coords < 0) or np.any(coords >= shape):
+        return False
+
+    index = coords @ strides
+    cells = flat[index]
+    empty[:] = cells == 0
+    if not np.all(empty | (cells == word_codes)):
+        return False
+
+    flat[index] = word_codes
+    return True
+
+
+_try_place = _place_loop if HAS_NUMBA else _place_vectorized
+
+
+@njit(cache=True)
+def _write_variations_loop(flat: np.ndarray, shape: np.ndarray, strides: np.ndarray, starts: np.ndarray,
+                           directions: np.ndarray, chr_codes: np.ndarray, chr_lens: np.ndarray) -> int:
+    """Write a batch of variations into the flattened grid codes.
+
+    Each variation is written until it either ends or leaves the grid.
+    Where variations overlap, the last one wins.
+
+    Parameters:
+        flat: Flattened grid of letter codes.
+        shape: Shape of the grid.
+        strides: Number of flat cells to move per step along each axis.
+        starts: Coordinate of the first letter of each variation.
+        directions: Step to take between each letter of each variation.
+        chr_codes: Padded letter codes of each variation.
+        chr_lens: Length of each variation.
+
+    Returns:
+        Number of empty cells that were filled.
+    """
+    filled = 0
+    for i in range(len(starts)):
+        for j in range(chr_lens[i]):
+            index = 0
+            inside = True
+            for axis in range(len(shape)):
+                coord = starts[i, axis] + directions[i, axis] * j
+                if coord < 0 or coord >= shape[axis]:
+                    inside = False
+                    break
+                index += coord * strides[axis]
+            if not inside:
+                break
+            if flat[index] == 0:
+                filled += 1
+            flat[index] = chr_codes[i, j]
+    return filled
+
+
+def _write_variations_vectorized(flat: np.ndarray, shape: np.ndarray, strides: np.ndarray, starts: np.ndarray,
+                                 directions: np.ndarray, chr_codes: np.ndarray, chr_lens: np.ndarray) -> int:
+    """Write a batch of variations into the flattened grid codes.
+
+    This is used when numba is not available.
+    See `_write_variations_loop` for the parameters.
+    """
+    steps = np.arange(chr_codes.shape[1])
+    coords = starts[:, None, :] + steps[None, :, None] * directions[:, None, :]
+    inside = np.all((coords >= 0) & (coords < shape), axis=2) & (steps < chr_lens[:, None])
+    valid = np.logical_and.accumulate(inside, axis=1)
+    index = coords[valid] @ strides
+    filled = np.count_nonzero(flat[np.unique(index)] == 0)
+    flat[index] = chr_codes[valid]
+    return filled
+
+
+_write_variations = _write_variations_loop if HAS_NUMBA else _write_variations_vectorized
+
+
 @dataclass
 class Difficulty:
     """Difficulty settings for the word search.
@@ -68,16 +248,46 @@ class Difficulty:
     copy_letter_chance: float = 0.15
     density_target_words: float = 0.7
     density_target_variations: float = 0.5
+    _direction_tables: Dict[Tuple[int, int, bool], np.ndarray] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+
+    def _build_direction_table(self, dimensions: int) -> np.ndarray:
+        """Enumerate every direction allowed for the number of dimensions."""
+        steps = (-1, 0, 1) if self.backwards else (0, 1)
+        directions = [direction for direction in itertools.product(steps, repeat=dimensions)
+                      if 0 < sum(map(bool, direction)) <= self.level]
+        table = np.array(directions, dtype=np.int8).reshape(-1, dimensions)
+        table.flags.writeable = False
+        return table
+
+    def directions(self, dimensions: int) -> np.ndarray:
+        """Get every direction allowed for the number of dimensions.
+        The result is cached for the current settings.
 
-    def generate_direction(self, dimensions: int) -> Tuple[int]:
-        """Choose a new direction based on the number of dimensions."""
-        direction = [0] * dimensions
-        choice = list(range(dimensions))
-        for _ in range(self.level):
-            idx = random.choice(choice)
-            choice.remove(idx)
-            direction[idx] = random.randint(-1, 1) if self.backwards else 1
-        return tuple(direction)
+        Returns:
+            Read only array of shape (K, dimensions), with one direction per row.
+        """
+        key = (dimensions, self.level, self.backwards)
+        if key not in self._direction_tables:
+            self._direction_tables[key] = self._build_direction_table(dimensions)
+        return self._direction_tables[key]
+
+    def generate_direction(self, dimensions: int, rng: Optional[np.random.Generator] = None) -> Tuple[int]:
+        """Choose a new direction based on the number of dimensions.
+
+        Parameters:
+            dimensions: Number of word search dimensions.
+            rng: Random generator to use.
+                If not set, the random module will be used.
+        """
+        table = self.directions(dimensions)
+        if not len(table):
+            return (0,) * dimensions
+        if rng is None:
+            idx = random.randrange(len(table))
+        else:
+            idx = rng.integers(len(table))
+        return tuple(table[idx].tolist())
 
 
 class WordSearch(object):
@@ -106,12 +316,24 @@ class WordSearch(object):
         else:
             self.difficulty = difficulty
 
-        self._data_words = np.zeros(self.shape, dtype=str)
-        self._data_variations = np.zeros(self.shape, dtype=str)
-        self._data_fill = np.zeros(self.shape, dtype=str).ravel()
+        # Letters are stored as codes, where 0 is empty and 1-26 is a-z
+        self._data_words = np.zeros(self.shape, dtype=np.int8)
+        self._data_variations = np.zeros(self.shape, dtype=np.int8)
+        self._data_fill = np.zeros(self.shape, dtype=np.int8).ravel()
+        self._data_words_flat = self._data_words.ravel()
+        self._shape = np.array(self.shape)
+        self._strides = np.array(self._data_words.strides) // self._data_words.itemsize
+        self._max_lengths_table: Optional[np.ndarray] = None
+        self._max_lengths_directions: Optional[np.ndarray] = None
         self.solutions: Dict[str, Tuple[Tuple[int], Tuple[int]]] = {}
+        self._placed_letters = np.empty(0, dtype=np.int8)
+        self._filled_words = 0
+
+        # Seed from the random module so random.seed() stays reproducible
+        self._rng = np.random.default_rng(random.getrandbits(64))
 
         self._req_update_variation = self._req_update_fill = True
+        self._cached_data: Optional[np.ndarray] = None
 
     def __str__(self):
         """Return the numpy string."""
@@ -121,48 +343,88 @@ class WordSearch(object):
     def data(self):
         """Get the raw data as a numpy array.
         This will generate any extra data as needed.
+        The array is cached and read only until another word is added.
         """
+        if self._cached_data is not None:
+            return self._cached_data
+
         # Regenerate the extra data
-        if self._req_update_fill:
-            self._generate_fill()
+        # The fill depends on the variations so must be done last
         if self._req_update_variation:
             self._generate_variations()
+        if self._req_update_fill:
+            self._generate_fill()
 
-        output = self._data_words
+        # Layer the words over the variations over the fill
+        words, variations = self._data_words, self._data_variations
+        fill = self._data_fill.reshape(self.shape)
+        output = np.where(words != 0, words, np.where(variations != 0, variations, fill))
+        self._cached_data = LETTERS[output]
+        self._cached_data.flags.writeable = False
+        return self._cached_data
 
-        # Add variations
-        where = np.where(output == '')
-        output[where] = self._data_variations[where]
+    @property
+    def _directions(self) -> np.ndarray:
+        """Get the direction table for the current difficulty."""
+        return self.difficulty.directions(self.dimensions)
 
-        # Add fill
-        where = np.where(output == '')
-        output[where] = self._data_fill.reshape(self.shape)[where]
+    @property
+    def _max_lengths(self) -> np.ndarray:
+        """Get the longest word that fits from each cell in each direction.
+        This is built on first use, one direction and axis at a time,
+        and rebuilt if the difficulty directions change.
 
-        return output
+        Returns:
+            Array of shape (directions, cells).
+        """
+        directions = self._directions
+        if self._max_lengths_table is None or self._max_lengths_directions is not directions:
+            limit = max(self.shape)
+            dtype = np.min_scalar_type(limit)
+            table = np.empty((len(directions), self._data_words.size), dtype=dtype)
+            for row, direction in zip(table, directions):
+                room = row.reshape(self.shape)
+                room[...] = limit
+                for axis, (step, size) in enumerate(zip(direction, self.shape)):
+                    if not step:
+                        continue
+                    axis_room = np.arange(size, 0, -1, dtype=dtype) if step > 0 else np.arange(1, size + 1, dtype=dtype)
+                    view_shape = [1] * self.dimensions
+                    view_shape[axis] = size
+                    np.minimum(room, axis_room.reshape(view_shape), out=room)
+            self._max_lengths_table = table
+            self._max_lengths_directions = directions
+        return self._max_lengths_table
 
     @property
     def words(self) -> List[str]:
         """Get a list of all words in the wordsearch."""
         return list(self.solutions)
 
-    def _add_word(self, word: str, check_count: bool = False, check_density: bool = False,
-                  retry_attempts: int = 10, placement_attempts: int = 25, direction_attempts: int = 5
-                  ) -> Optional[Tuple[Tuple[int], Tuple[int]]]:
+    def _add_word(self, word: str, word_codes: Optional[np.ndarray] = None,
+                  check_count: bool = False, check_density: bool = False,
+                  retry_attempts: int = 10, placement_attempts: int = 25, direction_attempts: int = 5,
+                  search_all: bool = False) -> Optional[Tuple[Tuple[int], Tuple[int]]]:
         """Insert a word into the wordsearch.
 
         Parameters:
             word: Word to add.
+            word_codes: Precomputed grid codes of the word.
+                If not set, they will be generated from the word.
             check_density: If the word density should be checked.
                 If True, then an error will be raised if too high.
             retry_attempts: How many times to attempt adding the worandom.
             placement_attempts: Find a starting point (per retry).
             direction_attempts: Find a direction from the starting point (per retry).
+            search_all: Search every placement at once if the random attempts fail.
+                This is slow on large grids, so is best kept for single words.
 
         Returns:
             The starting point and direction as tuples of ints.
 
         Raises:
             WordLengthError: If the word is too long or short.
+            WordCharacterError: If the word contains invalid characters.
             WordDensityError: If the word density is too high.
             NoMoreRetriesError: If the word failed to be added.
         """
@@ -174,135 +436,231 @@ class WordSearch(object):
         if len(word) < 3 or all(len(word) > size for size in self.shape):
             return WordLengthError(word)
 
+        if word_codes is None:
+            word_codes = encode_word(word)
+        empty = np.empty(len(word), dtype=np.bool_)
+
         # Check word density is not too high
         if check_density:
             target_size = self._data_words.size * self.difficulty.density_target_words
-            if np.sum(self._data_words != '') > target_size:
+            if self._filled_words > target_size:
                 raise WordDensityError
 
-        for _ in range(retry_attempts):
+        # Bind everything used in the retry loop
+        rng, flat, shape, strides = self._rng, self._data_words_flat, self._shape, self._strides
+        directions, max_lengths = self._directions, self._max_lengths
+
+        # Draw the start candidates for every retry at once
+        all_starts = rng.integers(0, shape, size=(retry_attempts, placement_attempts, self.dimensions))
+
+        for starts in all_starts:
             # Find a space where the word can start
-            for _ in range(placement_attempts):
-                start = tuple(random.randint(0, size - 1) for size in self.shape)
-                if self._data_words[start] in ('', word[0]):
-                    break
-            else:
-                raise NoMoreRetriesError(word)
+            # Skip any that have no room for the word in any direction
+            index = starts @ strides
+            cells = flat[index]
+            fits = max_lengths[:, index] >= len(word_codes)
+            valid = np.flatnonzero(((cells == 0) | (cells == word_codes[0])) & fits.any(axis=0))
+            if not valid.size:
+                break
+            start = starts[valid[0]]
+            legal = np.flatnonzero(fits[:, valid[0]])
 
             # Find a direction that allows the word to be added
-            attempted_directions = {(0,) * self.dimensions}
-            for _ in range(direction_attempts):
-                direction = self.difficulty.generate_direction(self.dimensions)
-
-                # Don't repeat previous attempts
-                if direction in attempted_directions:
-                    continue
-                attempted_directions.add(direction)
-
-                # Check the end point is still within bounds
-                if not all(-1 <= a + b * len(word) < c + 1 for a, b, c in zip(start, direction, self.shape)):
-                    continue
-
-                # Check the current direction words
-                location = start
-                for char in word:
-                    if self._data_words[location] not in ('', char):
-                        break
-                    location = tuple(map(sum, zip(location, direction)))
-
-                # Update the data
-                else:
-                    location = start
-                    for char in word:
-                        self._data_words[location] = char
-                        location = tuple(map(sum, zip(location, direction)))
-                    self.solutions[word] = start, direction
-                    self._req_update_fill = self._req_update_variation = True
-                    return start, direction
+            for idx in rng.permutation(legal)[:direction_attempts]:
+                if _try_place(flat, shape, strides, start, directions[idx], word_codes, empty):
+                    return self._record_word(word, start, directions[idx], word_codes[empty])
+
+        # Fall back to picking from every placement that fits
+        if search_all:
+            placements = self._find_placements(word_codes)
+            if len(placements):
+                cell, idx = placements[rng.integers(len(placements))]
+                start = np.array(np.unravel_index(cell, self.shape))
+                _try_place(flat, shape, strides, start, directions[idx], word_codes, empty)
+                return self._record_word(word, start, directions[idx], word_codes[empty])
 
         raise NoMoreRetriesError(word)
 
+    def _find_placements(self, word_codes: np.ndarray) -> np.ndarray:
+        """Find every start cell and direction where a word fits.
+
+        Each direction is checked one letter at a time across every
+        start cell, so memory stays proportional to the grid size.
+
+        Returns:
+            Array of (flat start index, direction index) rows.
+        """
+        length = len(word_codes)
+        placements = [np.empty((0, 2), dtype=np.intp)]
+        for idx, (room, direction) in enumerate(zip(self._max_lengths, self._directions)):
+            cells = np.flatnonzero(room >= length)
+            step = direction @ self._strides
+            for i, code in enumerate(word_codes):
+                letters = self._data_words_flat[cells + i * step]
+                cells = cells[(letters == 0) | (letters == code)]
+            placements.append(np.stack([cells, np.full_like(cells, idx)], axis=1))
+        return np.concatenate(placements)
+
+    def _record_word(self, word: str, start: np.ndarray, direction: np.ndarray,
+                     new_codes: np.ndarray) -> Tuple[Tuple[int], Tuple[int]]:
+        """Store a word that has just been written to the grid.
+
+        Parameters:
+            word: Word that was added.
+            start: Coordinate of the first letter.
+            direction: Step taken between each letter.
+            new_codes: Letter codes that went into empty cells.
+
+        Returns:
+            The starting point and direction as tuples of ints.
+        """
+        start = tuple(start.tolist())
+        direction = tuple(direction.tolist())
+        self._placed_letters = np.concatenate([self._placed_letters, new_codes])
+        self._filled_words += len(new_codes)
+        self.solutions[word] = start, direction
+        self._req_update_fill = self._req_update_variation = True
+        self._cached_data = None
+        return start, direction
+
     def add_word(self, word: str, **kwargs: Any) -> None:
-        """Add a single word."""
+        """Add a single word.
+        The word is converted to lowercase before being added.
+
+        Raises:
+            WordCharacterError: If the word contains anything other than a-z.
+        """
         kwargs.setdefault('check_density', False)
         kwargs.setdefault('check_count', False)
         with suppress(NoMoreRetriesError):
-            self._add_word(word, **kwargs)
+            self._add_word(word.lower(), **kwargs)
 
-    def add_words(self, words: List[str], **kwargs: Any) -> None:
-        """Add multiple words at once."""
+    def add_words(self, words: Iterable[str], **kwargs: Any) -> None:
+        """Add multiple words at once.
+        Words containing anything other than a-z are skipped.
+        """
         kwargs.setdefault('check_density', False)
         kwargs.setdefault('check_count', False)
-        for word in words:
+        words = [word.lower() for word in words]
+        for word, word_codes in zip(words, encode_words(words)):
+            if word_codes is None:
+                continue
             with suppress(WordLengthError):
-                self.add_word(word, **kwargs)
+                self.add_word(word, word_codes=word_codes, **kwargs)
 
-    def load_word_file(self, path: str = 'wordsEn.txt', **kwargs) -> None:
+    def load_word_file(self, path: str = 'wordsEn.txt', batch_size: int = 1024, **kwargs) -> None:
         """Load words from a file.
 
         Parameters:
             path: Path to a text file containing words.
+            batch_size: How many words to add at once.
+                Loading stops early once the word count or density is reached.
         """
         with open(path, 'r') as f:
-            words = [line.strip() for line in f]
-        random.shuffle(words)
+            words = np.array(f.read().split(), dtype=str)
+
+        # Drop any words that could never fit
+        lengths = np.char.str_len(words)
+        words = words[(lengths >= 3) & (lengths <= max(self.shape))]
+        order = self._rng.permutation(len(words))
 
         kwargs.setdefault('check_density', True)
         kwargs.setdefault('check_count', True)
         with suppress(WordDensityError, WordCountError):
-            self.add_words(words, **kwargs)
+            for i in range(0, len(order), batch_size):
+                self.add_words(words[order[i:i + batch_size]].tolist(), **kwargs)
 
     def _generate_fill(self) -> None:
         """Generate random letter data.
 
         This has a chance to duplicate existing letters instead of
         selecting entirely new ones.
+        Only cells not covered by words or variations are filled.
         """
-        letter_choices = tuple(self._data_words[np.where(self._data_words != '')])
-        for i in range(self._data_fill.size):
-            if letter_choices and random.uniform(0, 1) > self.difficulty.copy_letter_chance:
-                self._data_fill[i] = random.choice(letter_choices)
-            else:
-                self._data_fill[i] = random.choice(string.ascii_lowercase)
+        empty = (self._data_words_flat == 0) & (self._data_variations.ravel() == 0)
+        size = np.count_nonzero(empty)
+        letter_choices = self._placed_letters
+        fill = self._rng.integers(1, len(LETTERS), size=size, dtype=np.int8)
+        if letter_choices.size:
+            copy = self._rng.random(size) > self.difficulty.copy_letter_chance
+            fill = np.where(copy, self._rng.choice(letter_choices, size=size), fill)
+        self._data_fill[:] = 0
+        self._data_fill[empty] = fill
         self._req_update_fill = False
 
-    def _generate_variations(self):
+    def _generate_variations(self, batch_size: int = 1024) -> None:
         """Generate word variations.
 
         This is to throw off the player by adding what looks like the
         full word at a quick glance.
-        """
-        words = list(self.solutions)
-        letter_choices = tuple(self._data_words[np.where(self._data_words != '')])
 
-        self._data_variations[:] = ''
-        while np.sum(self._data_variations != '') < self._data_variations.size * self.difficulty.density_target_variations:
-            word = random.choice(words)
-            chrs = list(word)
+        Parameters:
+            batch_size: Maximum number of variations to generate at once.
+        """
+        self._data_variations[:] = 0
+        self._req_update_variation = False
+        self._req_update_fill = True
+        if not self.solutions:
+            return
+
+        # Pad all the words into a single array
+        word_codes = [encode_word(word) for word in self.solutions]
+        word_lengths = np.array([len(codes) for codes in word_codes])
+        max_length = word_lengths.max()
+        word_table = np.zeros((len(word_codes), max_length), dtype=np.int8)
+        for i, codes in enumerate(word_codes):
+            word_table[i, :len(codes)] = codes
+
+        # Bind everything used in the batch loop
+        rng, shape, strides, direction_table = self._rng, self._shape, self._strides, self._directions
+
+        # Without any directions, variations can only place their first letter
+        if not len(direction_table):
+            direction_table = np.zeros((1, self.dimensions), dtype=np.int8)
+        placed_letters, copy_letter_chance = self._placed_letters, self.difficulty.copy_letter_chance
+        filled = 0
+
+        columns = np.arange(max_length)
+        changes = columns[:max_length // 2]
+        flat = self._data_variations.ravel()
+        target_size = flat.size * self.difficulty.density_target_variations
+        while True:
+            remaining = target_size - filled
+            if remaining <= 0:
+                break
+
+            # Each variation writes at most max_length cells, so avoid overshooting the target
+            batch = int(min(batch_size, -(-remaining // max_length)))
+            rows = np.arange(batch)[:, None]
+            idx = rng.integers(0, len(word_codes), batch)
+            chrs = word_table[idx]
+            lengths = word_lengths[idx]
 
             # Replace random letters in word
             # eg. word = ward, wore, wond, qerd
-            for _ in range(random.randint(0, len(chrs) // 2)):
-                if letter_choices and random.uniform(0, 1) > self.difficulty.copy_letter_chance:
-                    chrs[random.randint(0, len(chrs) - 1)] = random.choice(letter_choices)
-                else:
-                    chrs[random.randint(0, len(chrs) - 1)] = random.choice(string.ascii_lowercase)
+            count = rng.integers(0, lengths // 2, endpoint=True)
+            positions = rng.integers(0, lengths[:, None], size=(batch, len(changes)))
+            letters = rng.integers(1, len(LETTERS), size=(batch, len(changes)), dtype=np.int8)
+            if placed_letters.size:
+                copy = rng.random((batch, len(changes))) > copy_letter_chance
+                letters = np.where(copy, rng.choice(placed_letters, size=copy.shape), letters)
+            replace = changes < count[:, None]
+            chrs[np.broadcast_to(rows, replace.shape)[replace], positions[replace]] = letters[replace]
 
             # Remove random letters from the word
             # eg. word = wrd, wod
-            for _ in range(random.randint(0, len(chrs) // 2)):
-                del chrs[random.randint(0, len(chrs) - 1)]
-
-            # Add the word to the variations data
-            direction = self.difficulty.generate_direction(self.dimensions)
-            location = tuple(random.randint(0, size - 1) for size in self.shape)
-            for char in chrs:
-                if not all(-1 <= a + b < c + 1 for a, b, c in zip(location, direction, self.shape)):
-                    break
-                self._data_variations[location] = char
-                location = tuple(map(sum, zip(location, direction)))
-
-        self._req_update_variation = False
+            count = rng.integers(0, lengths // 2, endpoint=True)
+            padding = columns >= lengths[:, None]
+            keys = rng.random((batch, max_length))
+            keys[padding] = np.inf
+            keep = (keys.argsort(axis=1).argsort(axis=1) >= count[:, None]) & ~padding
+            chrs = np.take_along_axis(chrs, np.argsort(~keep, axis=1, kind='stable'), axis=1)
+            lengths = keep.sum(axis=1)
+
+            # Add the words to the variations data
+            directions = direction_table[rng.integers(0, len(direction_table), batch)]
+            starts = rng.integers(0, shape, size=(batch, self.dimensions))
+            filled += _write_variations(flat, shape, strides, starts, directions, chrs, lengths)
 
     def display(self, debug_solutions: bool = False) -> None:
         """Print the wordsearch to the console.
@@ -318,34 +676,34 @@ class WordSearch(object):
 
             >>> ws.display()
             Words: words, example, generate, hard, easy, search
-            e x a m p l e s g s
-            m d d o n r g h e e
-            s r o d n n e r n d
-            e l a d i a e e e x
-            a e e d e e a a r d
-            r s m w t l s s a g
-            c t l o e x x y t s
-            h h a r d d n h e n
-            w c w d y g e x e e
-            r x a s e a r r t e
+            t r p o s r e x g e
+            a r m r a r r e e x
+            a e c d r e e a n a
+            h w r s c s r s e m
+            g o c h a e k y r p
+            e r h a h v s r t l
+            n d d r t r s l e e
+            e s c d k h e c l a
+            s e a r c h e s d h
+            o h g e n e r a t e
 
             >>> ws.display(debug_solutions=True)
-            words: (5, 3) to (10, 3)
-            example: (0, 0) to (0, 7)
-            generate: (0, 8) to (8, 8)
-            hard: (7, 1) to (7, 5)
-            easy: (3, 7) to (7, 7)
-            search: (2, 0) to (8, 0)
-            e x a m p l e   g  
-                            e  
-            s               n  
-            e             e e  
-            a             a r  
-            r     w       s a  
-            c     o       y t  
-            h h a r d       e  
-                  d            
-                  s            
+            words: (3, 1) to (8, 1)
+            example: (0, 9) to (7, 9)
+            generate: (9, 2) to (9, 10)
+            hard: (4, 3) to (8, 3)
+            easy: (1, 7) to (5, 7)
+            search: (8, 0) to (8, 6)
+                              e
+                          e   x
+                          a   a
+              w           s   m
+              o   h       y   p
+              r   a           l
+              d   r           e
+              s   d            
+            s e a r c h        
+                g e n e r a t e
         """
         if debug_solutions:
             # Print the solutions
@@ -354,25 +712,22 @@ class WordSearch(object):
                 print(f'{word}: {start} to {end}')
 
             # Generate the data
-            raw = self._data_words
-
-            data = np.zeros(self.shape, dtype=str)
-            data[:] = ' '
+            data = np.full(self._data_words.size, ' ')
             for word, (start, direction) in self.solutions.items():
-                for i in range(len(word)):
-                    idx = tuple(a + b * i for a, b in zip(start, direction))
-                    data[idx] = raw[idx]
+                step = np.array(direction) @ self._strides
+                index = np.array(start) @ self._strides + np.arange(len(word)) * step
+                data[index] = LETTERS[self._data_words_flat[index]]
+            data = data.reshape(self.shape)
         else:
             print(f'Words: {", ".join(self.words)}')
             data = self.data
 
         # Print differently based on the dimension
         if self.dimensions == 1:
-            print(' '.join(c for c in data.ravel()))
+            print(' '.join(data))
 
         elif self.dimensions == 2:
-            for y in range(self.shape[0]):
-                print(' '.join(data[y]))
+            print('\n'.join(map(' '.join, data)))
 
         else:
             raise RuntimeError('unable to display more than 2 dimensions')